@@ -1,17 +1,186 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import List, Optional, Protocol
+import itertools
+import logging
+import os
+import sys
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Protocol
 
-@dataclass
+log = logging.getLogger("taskanov.backend")
+
+# No per-instance __dict__ where supported (dataclass slots need Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Task:
     id: str
     title: str
     done: bool = False
     list_title: Optional[str] = None
+    # derived, computed once at construction (not persisted): lowercased copies
+    # for search and the "List / title" row label shown by the TUI
+    title_lower: str = field(init=False, repr=False, compare=False)
+    list_title_lower: Optional[str] = field(init=False, repr=False, compare=False)
+    label: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.title_lower = self.title.lower()
+        self.list_title_lower = self.list_title.lower() if self.list_title else None
+        self.label = f"{self.list_title.replace(' ', '')} / {self.title}" if self.list_title else self.title
+
+
+# Process-wide so a rebuilt index never reuses a version seen before
+_versions = itertools.count(1)
+
+
+class TaskIndex:
+    """
+    In-memory task store shared by backends.
+    Tasks are kept in insertion order, indexed by id, partitioned into open/done
+    and (open tasks only) indexed by title, so lookups and mutations are O(1)
+    and listing one side never touches the other.
+    `version` changes on every mutation, so callers can cache derived views.
+    """
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        self.version = next(_versions)
+        self._by_id: Dict[str, Task] = {}
+        self._open: Dict[str, Task] = {}
+        self._done: Dict[str, Task] = {}
+        self._open_titles: Dict[str, Dict[str, Task]] = {}
+        for t in tasks:
+            self.add(t)
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self._by_id.values())
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def get(self, task_id: str) -> Optional[Task]:
+        return self._by_id.get(task_id)
+
+    def open(self) -> List[Task]:
+        return list(self._open.values())
+
+    def done(self) -> List[Task]:
+        return list(self._done.values())
+
+    def add(self, t: Task) -> None:
+        self.remove(t.id)
+        self._by_id[t.id] = t
+        if t.done:
+            self._done[t.id] = t
+        else:
+            self._open[t.id] = t
+            self._open_titles.setdefault(t.title, {})[t.id] = t
+        self.version = next(_versions)
+
+    def remove(self, task_id: str) -> Optional[Task]:
+        t = self._by_id.pop(task_id, None)
+        if t is None:
+            return None
+        if t.done:
+            del self._done[task_id]
+        else:
+            del self._open[task_id]
+            self._forget_title(t)
+        self.version = next(_versions)
+        return t
+
+    def set_done(self, t: Task, done: bool) -> None:
+        if t.done == done:
+            return
+        t.done = done
+        if done:
+            del self._open[t.id]
+            self._done[t.id] = t
+            self._forget_title(t)
+        else:
+            del self._done[t.id]
+            self._open[t.id] = t
+            self._open_titles.setdefault(t.title, {})[t.id] = t
+        # bumped last: a reader racing the mutation never caches a half-applied state
+        self.version = next(_versions)
+
+    def find_open(self, title: str) -> Optional[Task]:
+        same = self._open_titles.get(title)
+        return next(iter(same.values())) if same else None
+
+    def _forget_title(self, t: Task) -> None:
+        same = self._open_titles.get(t.title)
+        if same is not None:
+            same.pop(t.id, None)
+            if not same:
+                del self._open_titles[t.title]
+
+
+def atomic_write_bytes(path: Path, data: bytes, durable: bool = False) -> None:
+    """
+    Write to a sibling temp file, then rename over `path` (readers never see a partial file).
+    durable=True also fsyncs the data before the rename and the directory after it, so
+    the new contents survive a crash (needed before discarding anything they replace).
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(data)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, path)
+    if durable and os.name == "posix":
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class DebouncedFlusher:
+    """
+    Coalesces bursts of state changes into one write.
+    mark() flags pending state; a daemon thread calls `flush` at most once per `delay`.
+    close() stops the thread and performs a final synchronous flush.
+    """
+
+    def __init__(self, flush: Callable[[], None], delay: float = 0.2, name: str = "state-flusher"):
+        self._flush = flush
+        self._delay = delay
+        self._dirty = threading.Event()
+        self._closed = threading.Event()
+        self._thr = threading.Thread(target=self._run, daemon=True, name=name)
+        self._thr.start()
+
+    def mark(self) -> None:
+        self._dirty.set()
+
+    def close(self) -> None:
+        self._closed.set()
+        self._dirty.set()
+        self._thr.join(timeout=2)
+        self._flush()
+
+    def _run(self) -> None:
+        while not self._closed.is_set():
+            self._dirty.wait()
+            # debounce; close() cuts the wait short and does the final flush itself
+            if self._closed.wait(self._delay):
+                return
+            self._dirty.clear()
+            try:
+                self._flush()
+            except Exception:
+                log.exception("flush failed")
 
 # Unified backend interface (CRUD + timer state)
 class Backend(Protocol):
     # Tasks
+    # Changes whenever the task lists change (refresh or mutation)
+    version: int
+
     def refresh(self) -> None: ...
     def list_open(self) -> List[Task]: ...
     def list_done(self) -> List[Task]: ...
@@ -20,7 +189,13 @@ class Backend(Protocol):
     def ensure(self, title: str) -> Task: ...
 
     # Timer state (backend-owned)
+    # Notified on every start/stop so observers don't have to poll
+    timer_changed: threading.Condition
+
     # Returns (active, title, started_ts)
     def get_active_timer(self) -> tuple[bool, str, float]: ...
     def start_timer(self, title: str, started_ts: float) -> None: ...
     def stop_timer(self, ended_ts: float) -> None: ...
+
+    # Flush pending writes and release resources
+    def close(self) -> None: ...
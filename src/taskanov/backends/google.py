@@ -2,26 +2,35 @@
 from __future__ import annotations
 from pathlib import Path
 from typing import List, Optional, Dict, Tuple
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import logging
 import os
-import json
 import time
+import threading
 import datetime as dt
 
+import orjson
 from dateutil import tz
 try:
     # google deps (declare in pyproject)
     from google.oauth2.credentials import Credentials
     from google_auth_oauthlib.flow import InstalledAppFlow
     from google.auth.transport.requests import Request
+    from google.auth.exceptions import RefreshError
     from googleapiclient.discovery import build
+    from googleapiclient.errors import HttpError, BatchError
+    import google_auth_httplib2
+    import httplib2
 except Exception as e:
     raise RuntimeError(
         "ERROR: install missing deps [project.dependencies]: "
         "'google-api-python-client', 'google-auth-httplib2', 'google-auth-oauthlib', 'python-dateutil'"
     ) from e
 
-from .base import Task
+from .base import Task, TaskIndex, DebouncedFlusher, atomic_write_bytes
+
+log = logging.getLogger("taskanov.google")
 
 SCOPES = [
     "https://www.googleapis.com/auth/tasks",
@@ -39,7 +48,13 @@ CANDIDATE_CREDENTIAL_PATHS = [
 
 DEFAULT_CALENDAR_NAME = "taskanov"
 
+# Max sub-requests per batched HTTP call
+_BATCH_SIZE = 100
+# Concurrent per-list fetches when the batch endpoint is unavailable
+_FETCH_WORKERS = 8
+
 
+@lru_cache(maxsize=1)
 def _discover_credentials_path() -> Path:
     for p in CANDIDATE_CREDENTIAL_PATHS:
         if not p:
@@ -57,32 +72,80 @@ def _token_path_for(creds_path: Path) -> Path:
     return creds_path.with_name("token.json")
 
 
-def _load_credentials() -> Credentials:
-    creds_path = _discover_credentials_path()
-    token_path = _token_path_for(creds_path)
-    creds: Optional[Credentials] = None
+# Process-wide cache: credentials are loaded once and refreshed in place,
+# service clients are built once per credentials object.
+# token.json is only re-read when its mtime changes (e.g. another process re-authenticated).
+_lock = threading.Lock()
+_creds_singleton: Optional[Credentials] = None
+_token_mtime: Optional[float] = None
+_tasks_svc = None
+_cal_svc = None
 
-    if token_path.exists():
-        creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
 
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file(str(creds_path), SCOPES)
-            creds = flow.run_local_server(port=0)
-        token_path.write_text(creds.to_json())
-    return creds
+def _mtime(path: Path) -> Optional[float]:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def _load_credentials() -> Credentials:
+    global _creds_singleton, _token_mtime, _tasks_svc, _cal_svc
+    with _lock:
+        creds_path = _discover_credentials_path()
+        token_path = _token_path_for(creds_path)
+        mtime = _mtime(token_path)
+
+        creds = _creds_singleton
+        if creds is not None and mtime != _token_mtime:
+            creds = None
+        if creds and creds.valid:
+            return creds
+
+        if creds is None and mtime is not None:
+            creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+            _token_mtime = mtime
+
+        if not creds or not creds.valid:
+            refreshed = False
+            if creds and creds.expired and creds.refresh_token:
+                try:
+                    creds.refresh(Request())
+                    refreshed = True
+                except RefreshError:
+                    # revoked/expired refresh token: drop everything and re-auth
+                    _tasks_svc = _cal_svc = None
+            if not refreshed:
+                flow = InstalledAppFlow.from_client_secrets_file(str(creds_path), SCOPES)
+                creds = flow.run_local_server(port=0)
+            token_path.write_text(creds.to_json())
+            _token_mtime = _mtime(token_path)
+
+        if creds is not _creds_singleton:
+            _tasks_svc = _cal_svc = None
+        _creds_singleton = creds
+        return creds
 
 
 def _tasks_service():
-    return build("tasks", "v1", credentials=_load_credentials(), cache_discovery=False)
+    global _tasks_svc
+    creds = _load_credentials()
+    with _lock:
+        if _tasks_svc is None:
+            _tasks_svc = build("tasks", "v1", credentials=creds, cache_discovery=False)
+        return _tasks_svc
 
 
 def _calendar_service():
-    return build("calendar", "v3", credentials=_load_credentials(), cache_discovery=False)
+    global _cal_svc
+    creds = _load_credentials()
+    with _lock:
+        if _cal_svc is None:
+            _cal_svc = build("calendar", "v3", credentials=creds, cache_discovery=False)
+        return _cal_svc
 
 
+@lru_cache(maxsize=256)
 def _to_rfc3339(ts: float) -> str:
     d = dt.datetime.fromtimestamp(ts, tz=LOCAL_TZ)
     return d.isoformat()
@@ -104,11 +167,15 @@ def _ensure_calendar(name: str = DEFAULT_CALENDAR_NAME) -> str:
     return created["id"]
 
 
-def _write_time_slot(start_ts: float, end_ts: float, summary: str, description: str = "", calendar_name: str = DEFAULT_CALENDAR_NAME):
+def _is_not_found(e: HttpError) -> bool:
+    return getattr(e.resp, "status", None) == 404
+
+
+def _write_time_slot(start_ts: float, end_ts: float, summary: str, description: str = "", calendar_name: str = DEFAULT_CALENDAR_NAME, calendar_id: Optional[str] = None):
     if end_ts <= start_ts:
         raise ValueError("ended_ts deve essere > started_ts")
     cal = _calendar_service()
-    cal_id = _ensure_calendar(calendar_name)
+    cal_id = calendar_id or _ensure_calendar(calendar_name)
     body = {
         "summary": summary,
         "description": description,
@@ -127,42 +194,82 @@ class GoogleBackend:
     def __init__(self, path: Path, preferred_tasklist: Optional[str] = None, calendar_name: str = DEFAULT_CALENDAR_NAME):
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._cache: List[Task] = []
+        self._cache = TaskIndex()
         self._id_index: Dict[str, Tuple[str, str]] = {}
+        # tasklist id -> title, filled by refresh()/list_lists()
+        self._list_names: Dict[str, str] = {}
         self._preferred_tasklist_name = preferred_tasklist
         self._calendar_name = calendar_name
+        # resolved once per session; dropped when Google answers 404
+        self._default_list_id_cache: Optional[str] = None
+        self._calendar_id_cache: Dict[str, str] = {}
 
-        self.timer_file = self.path.with_name("timer_state.json")
+        # timer state lives inline in the local state file: {"timer": {...}}
         self._timer_active: bool = False
         self._timer_title: str = ""
         self._timer_started: float = 0.0
-        self._load_timer()
+        self.timer_changed = threading.Condition()
+        # last timer state written to disk; identical states are not rewritten
+        self._persisted_timer: Optional[dict] = None
+        self._flusher = DebouncedFlusher(self._write_state, name="google-flusher")
+        self._load_state()
 
         self.refresh()
 
     # ---------------- timer state ----------------
-    def _load_timer(self) -> None:
+    def _load_state(self) -> None:
+        # Older versions kept the timer in a separate timer_state.json
+        legacy = self.path.with_name("timer_state.json")
+        migrate = not self.path.exists() and legacy.exists()
         try:
-            if self.timer_file.exists():
-                data = json.loads(self.timer_file.read_text())
-                self._timer_active = bool(data.get("active", False))
-                self._timer_title = str(data.get("title", ""))
-                self._timer_started = float(data.get("started", 0.0))
+            if migrate:
+                data = orjson.loads(legacy.read_bytes())
+            elif self.path.exists():
+                data = orjson.loads(self.path.read_bytes()).get("timer") or {}
+            else:
+                data = {}
+            self._timer_active = bool(data.get("active", False))
+            self._timer_title = str(data.get("title", ""))
+            self._timer_started = float(data.get("started", 0.0))
         except Exception:
             self._timer_active, self._timer_title, self._timer_started = False, "", 0.0
+            return
+        if migrate:
+            # fields are loaded: write the new file now, drop the old one once it exists
+            self._write_state()
+            if self.path.exists():
+                legacy.unlink(missing_ok=True)
+        elif self.path.exists():
+            self._persisted_timer = self._timer_dict()
 
     def _save_timer(self) -> None:
+        self._flusher.mark()
+
+    def _timer_dict(self) -> dict:
+        return {
+            "active": self._timer_active,
+            "title": self._timer_title,
+            "started": self._timer_started,
+        }
+
+    def _write_state(self) -> None:
+        timer = self._timer_dict()
+        if timer == self._persisted_timer:
+            return
         try:
-            self.timer_file.write_text(json.dumps({
-                "active": self._timer_active,
-                "title": self._timer_title,
-                "started": self._timer_started,
-            }))
+            # ephemeral state: atomic rename, no fsync
+            atomic_write_bytes(self.path, orjson.dumps({"timer": timer}))
+            self._persisted_timer = timer
         except Exception:
             pass
 
     # ---------------- helpers ----------------
     def _default_list_id(self) -> str:
+        if self._default_list_id_cache is None:
+            self._default_list_id_cache = self._lookup_default_list_id()
+        return self._default_list_id_cache
+
+    def _lookup_default_list_id(self) -> str:
         svc = _tasks_service()
 
         page = svc.tasklists().list(maxResults=100).execute()
@@ -177,6 +284,12 @@ class GoogleBackend:
             return created["id"]
         return lists[0]["id"]
 
+    def _calendar_id(self) -> str:
+        name = self._calendar_name
+        if name not in self._calendar_id_cache:
+            self._calendar_id_cache[name] = _ensure_calendar(name)
+        return self._calendar_id_cache[name]
+
     def _split_gid(self, gid: str) -> Tuple[str, str]:
         list_id, task_id = gid.split("::", 1)
         return list_id, task_id
@@ -184,32 +297,107 @@ class GoogleBackend:
     # ---------------- Backend API ----------------
     def refresh(self) -> None:
         svc = _tasks_service()
-        self._cache = []
-        self._id_index = {}
 
+        lists: List[Tuple[str, Optional[str]]] = []
         lists_req = svc.tasklists().list(maxResults=100)
         while lists_req is not None:
             lists_resp = lists_req.execute()
             for lst in lists_resp.get("items", []):
-                list_id = lst["id"]
-                tasks_req = svc.tasks().list(tasklist=list_id, showDeleted=False, maxResults=100)
-                while tasks_req is not None:
-                    tasks_resp = tasks_req.execute()
-                    for t in tasks_resp.get("items", []):
-                        status = t.get("status", "needsAction")
-                        done = status == "completed"
-                        title = t.get("title") or "(senza titolo)"
-                        gid = f"{list_id}::{t['id']}"
-                        self._cache.append(Task(id=gid, title=title, done=done, list_title=lst.get("title")))
-                        self._id_index[gid] = (list_id, t["id"])
-                    tasks_req = svc.tasks().list_next(tasks_req, tasks_resp)
+                lists.append((lst["id"], lst.get("title")))
             lists_req = svc.tasklists().list_next(lists_req, lists_resp)
 
+        self._list_names = {list_id: title or "" for list_id, title in lists}
+        list_ids = [list_id for list_id, _ in lists]
+        items = self._fetch_batched(svc, list_ids)
+        if items is None:
+            items = self._fetch_threaded(list_ids)
+
+        # Build off to the side and swap in once: readers never see a half-filled index
+        cache = TaskIndex()
+        id_index: Dict[str, Tuple[str, str]] = {}
+        for list_id, list_title in lists:
+            for t in items[list_id]:
+                status = t.get("status", "needsAction")
+                done = status == "completed"
+                title = t.get("title") or "(senza titolo)"
+                gid = f"{list_id}::{t['id']}"
+                cache.add(Task(id=gid, title=title, done=done, list_title=list_title))
+                id_index[gid] = (list_id, t["id"])
+        self._cache = cache
+        self._id_index = id_index
+
+    def _fetch_batched(self, svc, list_ids: List[str]) -> Optional[Dict[str, list]]:
+        """
+        Fetch every tasklist in one batched HTTP request; lists with more
+        pages are fetched in follow-up batches until all are drained.
+        Returns None if the batch endpoint itself fails.
+        """
+        items: Dict[str, list] = {list_id: [] for list_id in list_ids}
+        pending: Dict[str, Optional[str]] = {list_id: None for list_id in list_ids}
+        while pending:
+            next_pending: Dict[str, Optional[str]] = {}
+            errors: list = []
+
+            def on_page(request_id, resp, exc):
+                if exc is not None:
+                    errors.append(exc)
+                    return
+                items[request_id].extend(resp.get("items", []))
+                if resp.get("nextPageToken"):
+                    next_pending[request_id] = resp["nextPageToken"]
+
+            chunk = list(pending.items())
+            for i in range(0, len(chunk), _BATCH_SIZE):
+                batch = svc.new_batch_http_request(callback=on_page)
+                for list_id, token in chunk[i:i + _BATCH_SIZE]:
+                    kwargs = {"pageToken": token} if token else {}
+                    batch.add(
+                        svc.tasks().list(tasklist=list_id, showDeleted=False, maxResults=100, **kwargs),
+                        request_id=list_id,
+                    )
+                try:
+                    batch.execute()
+                except (HttpError, BatchError):
+                    log.warning("batch request failed, fetching tasklists one by one", exc_info=True)
+                    return None
+            if errors:
+                raise errors[0]
+            pending = next_pending
+        return items
+
+    def _fetch_threaded(self, list_ids: List[str]) -> Dict[str, list]:
+        # httplib2.Http is not thread-safe: every worker gets its own authorized connection
+        creds = _load_credentials()
+        local = threading.local()
+
+        def fetch(list_id: str) -> list:
+            if not hasattr(local, "http"):
+                local.http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
+            return self._fetch_all_tasks(list_id, local.http)
+
+        with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as ex:
+            results = list(ex.map(fetch, list_ids))
+        return dict(zip(list_ids, results))
+
+    def _fetch_all_tasks(self, list_id: str, http) -> list:
+        svc = _tasks_service()
+        out: list = []
+        req = svc.tasks().list(tasklist=list_id, showDeleted=False, maxResults=100)
+        while req is not None:
+            resp = req.execute(http=http)
+            out.extend(resp.get("items", []))
+            req = svc.tasks().list_next(req, resp)
+        return out
+
+    @property
+    def version(self) -> int:
+        return self._cache.version
+
     def list_open(self) -> List[Task]:
-        return [t for t in self._cache if not t.done]
+        return self._cache.open()
 
     def list_done(self) -> List[Task]:
-        return [t for t in self._cache if t.done]
+        return self._cache.done()
 
     def toggle(self, task_id: str) -> Optional[Task]:
         if task_id not in self._id_index:
@@ -223,11 +411,10 @@ class GoogleBackend:
         else:
             body = {"status": "completed", "completed": now_iso}
         updated = svc.tasks().patch(tasklist=list_id, task=tid, body=body).execute()
-        for t in self._cache:
-            if t.id == task_id:
-                t.done = (updated.get("status") == "completed")
-                return t
-        return None
+        t = self._cache.get(task_id)
+        if t is not None:
+            self._cache.set_done(t, updated.get("status") == "completed")
+        return t
 
     def delete(self, task_id: str) -> Optional[Task]:
         if task_id not in self._id_index:
@@ -235,27 +422,27 @@ class GoogleBackend:
         list_id, tid = self._id_index[task_id]
         svc = _tasks_service()
         svc.tasks().delete(tasklist=list_id, task=tid).execute()
-        removed: Optional[Task] = None
-        new_list: List[Task] = []
-        for t in self._cache:
-            if t.id == task_id and removed is None:
-                removed = t
-                continue
-            new_list.append(t)
-        self._cache = new_list
         self._id_index.pop(task_id, None)
-        return removed
+        return self._cache.remove(task_id)
 
     def ensure(self, title: str) -> Task:
-        for t in self._cache:
-            if t.title == title and not t.done:
-                return t
+        t = self._cache.find_open(title)
+        if t is not None:
+            return t
         list_id = self._default_list_id()
         svc = _tasks_service()
-        created = svc.tasks().insert(tasklist=list_id, body={"title": title}).execute()
+        try:
+            created = svc.tasks().insert(tasklist=list_id, body={"title": title}).execute()
+        except HttpError as e:
+            if not _is_not_found(e):
+                raise
+            # cached default list was deleted remotely: resolve it again
+            self._default_list_id_cache = None
+            list_id = self._default_list_id()
+            created = svc.tasks().insert(tasklist=list_id, body={"title": title}).execute()
         gid = f"{list_id}::{created['id']}"
         nt = Task(id=gid, title=title, done=False)
-        self._cache.append(nt)
+        self._cache.add(nt)
         self._id_index[gid] = (list_id, created["id"])
         return nt
 
@@ -269,6 +456,7 @@ class GoogleBackend:
             for l in resp.get("items", []):
                 out.append((l["id"], l.get("title", "")))
             req = svc.tasklists().list_next(req, resp)
+        self._list_names = dict(out)
         return out
 
     def create_in_list(self, title: str, list_id: str) -> Task:
@@ -276,15 +464,12 @@ class GoogleBackend:
         created = svc.tasks().insert(tasklist=list_id, body={"title": title}).execute()
         gid = f"{list_id}::{created['id']}"
         t = Task(id=gid, title=title, done=False, list_title=self._list_name_by_id(list_id))
-        self._cache.append(t)
+        self._cache.add(t)
         self._id_index[gid] = (list_id, created["id"])
         return t
 
     def _list_name_by_id(self, list_id: str) -> str:
-        for lid, name in self.list_lists():
-            if lid == list_id:
-                return name
-        return "Tasks"
+        return self._list_names.get(list_id, "Tasks")
 
     # ---------------- Timer (backend-owned) ----------------
     def get_active_timer(self) -> tuple[bool, str, float]:
@@ -298,20 +483,39 @@ class GoogleBackend:
         self._timer_title = title
         self._timer_started = float(started_ts)
         self._save_timer()
+        self._notify_timer_changed()
 
     def stop_timer(self, ended_ts: float) -> None:
         if self._timer_active and self._timer_started > 0:
             try:
-                _write_time_slot(
-                    start_ts=self._timer_started,
-                    end_ts=float(ended_ts),
-                    summary=self._timer_title or "taskanov: work",
-                    description="Logged via taskanov",
-                    calendar_name=self._calendar_name,
-                )
+                try:
+                    self._log_time_slot(ended_ts)
+                except HttpError as e:
+                    if not _is_not_found(e):
+                        raise
+                    # cached calendar was deleted remotely: resolve it again
+                    self._calendar_id_cache.pop(self._calendar_name, None)
+                    self._log_time_slot(ended_ts)
             except Exception:
                 pass
         self._timer_active = False
         self._timer_title = ""
         self._timer_started = 0.0
         self._save_timer()
+        self._notify_timer_changed()
+
+    def _log_time_slot(self, ended_ts: float) -> None:
+        _write_time_slot(
+            start_ts=self._timer_started,
+            end_ts=float(ended_ts),
+            summary=self._timer_title or "taskanov: work",
+            description="Logged via taskanov",
+            calendar_id=self._calendar_id(),
+        )
+
+    def _notify_timer_changed(self) -> None:
+        with self.timer_changed:
+            self.timer_changed.notify_all()
+
+    def close(self) -> None:
+        self._flusher.close()
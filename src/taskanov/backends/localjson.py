@@ -1,108 +1,257 @@
 # src/taskanov/backends/localjson.py
 from __future__ import annotations
-import json, uuid, time
+import os, threading, uuid, time
 from pathlib import Path
-from typing import List, Optional
-from dataclasses import asdict
+from typing import Iterable, Iterator, List, Optional, Tuple
 
-from .base import Task, Backend
+import orjson
+try:
+    # optional: stream-parse large snapshots
+    import ijson
+except ImportError:
+    ijson = None
+
+from .base import Task, TaskIndex, DebouncedFlusher, atomic_write_bytes, Backend
+
+
+# Below this size a single orjson.loads beats incremental parsing
+STREAM_MIN_BYTES = 64 * 1024
+
+
+def _task_dict(t: Task) -> dict:
+    # Task is flat: build the dict directly instead of dataclasses.asdict's deep copy
+    return {"id": t.id, "title": t.title, "done": t.done, "list_title": t.list_title}
+
+
+def _task_from(d: dict) -> Task:
+    # positional call: no **kwargs unpacking, no setdefault on the parsed dict
+    return Task(d["id"], d["title"], d.get("done", False), d.get("list_title"))
 
 
 class LocalJsonBackend:
     """
     Local JSON storage backend.
-    - Tasks are stored as a JSON list of Task dicts.
-    - Timer state is persisted in a separate JSON file (timer_state.json).
+    - Tasks and timer state live in one snapshot: {"timer": {...}, "tasks": [Task dicts]}
+      (a bare list of tasks from older versions is still accepted).
+    - Single-task edits and timer changes are appended to a JSON Lines journal next
+      to the snapshot (tasks.jsonl) and replayed on refresh; the journal is folded
+      back into the snapshot once it grows past a few times the number of live tasks.
+    - Writes are coalesced by a background flusher; call close() to flush on exit.
     """
 
     def __init__(self, path: Path):
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        if not self.path.exists():
-            self._write([])
 
-        # in-memory cache of tasks
-        self._cache: List[Task] = []
-        self.refresh()
-
-        # timer state (persisted next to tasks file)
-        self.timer_file = self.path.with_name("timer_state.json")
+        # timer state (persisted in the same snapshot/journal as tasks)
         self._timer_active: bool = False
         self._timer_title: str = ""
         self._timer_started: float = 0.0
-        self._load_timer()
+        self.timer_changed = threading.Condition()
+
+        # in-memory cache of tasks
+        self._cache = TaskIndex()
+
+        if not self.path.exists():
+            self._write([])
+        self.journal = self.path.with_suffix(".jsonl")
+        self._journal_len = 0
+
+        # pending journal lines / timer change, written by the flusher thread
+        self._io_lock = threading.Lock()
+        self._pending: List[bytes] = []
+        # last journal append failed midway: the file may end in a partial line
+        self._journal_torn = False
+        self._timer_dirty = False
+        # last timer state written to disk; identical states are not rewritten
+        self._persisted_timer: Optional[dict] = None
+        self._flusher = DebouncedFlusher(self._flush, name="localjson-flusher")
+
+        if not self._reload():
+            self._migrate_timer_file()
 
     # ---------------- internal helpers ----------------
-    def _read(self) -> List[Task]:
-        data = json.loads(self.path.read_text() or "[]")
-        for t in data:
-            t.setdefault("list_title", None)
-        return [Task(**t) for t in data]
+    def _read(self) -> Tuple[Iterable[Task], Optional[dict]]:
+        if ijson is not None and self.path.stat().st_size >= STREAM_MIN_BYTES:
+            return self._read_stream()
+        data = orjson.loads(self.path.read_bytes() or b"[]")
+        if isinstance(data, list):
+            tasks, timer = data, None
+        else:
+            tasks, timer = data.get("tasks", []), data.get("timer")
+        return [_task_from(t) for t in tasks], timer
+
+    def _read_stream(self) -> Tuple[Iterator[Task], Optional[dict]]:
+        with self.path.open("rb") as f:
+            legacy = f.read(64).lstrip().startswith(b"[")
+            f.seek(0)
+            # "timer" is written before "tasks", so this stops early
+            timer = None if legacy else next(ijson.items(f, "timer"), None)
+
+        def tasks() -> Iterator[Task]:
+            with self.path.open("rb") as f:
+                for t in ijson.items(f, "item" if legacy else "tasks.item"):
+                    yield _task_from(t)
+
+        return tasks(), timer
+
+    def _write(self, tasks: List[Task], durable: bool = False) -> None:
+        atomic_write_bytes(self.path, orjson.dumps({
+            "timer": self._timer_dict(),
+            "tasks": [_task_dict(t) for t in tasks],
+        }), durable=durable)
+
+    def _replay(self, tasks: Iterable[Task], timer: Optional[dict]) -> Tuple[Iterable[Task], Optional[dict]]:
+        if not self.journal.exists():
+            self._journal_len = 0
+            return tasks, timer
+        by_id = {t.id: t for t in tasks}
+        n = 0
+        with self.journal.open("rb") as f:
+            for line in f:
+                try:
+                    rec = orjson.loads(line)
+                except ValueError:
+                    # torn write from a crash: ignore the partial line
+                    continue
+                n += 1
+                if rec["op"] == "timer":
+                    timer = rec["timer"]
+                    continue
+                t = rec["task"]
+                if rec["op"] == "delete":
+                    by_id.pop(t["id"], None)
+                else:
+                    by_id[t["id"]] = _task_from(t)
+        self._journal_len = n
+        return by_id.values(), timer
+
+    def _append(self, op: str, t: Task) -> None:
+        record = {"op": op, "task": _task_dict(t)}
+        with self._io_lock:
+            self._pending.append(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+        self._flusher.mark()
+
+    def _flush(self) -> None:
+        with self._io_lock:
+            lines, self._pending = self._pending, []
+            n_tasks = len(lines)
+            prev_timer = self._persisted_timer
+            if self._timer_dirty:
+                self._timer_dirty = False
+                timer = self._timer_dict()
+                if timer != self._persisted_timer:
+                    self._persisted_timer = timer
+                    lines.append(orjson.dumps({"op": "timer", "timer": timer}, option=orjson.OPT_APPEND_NEWLINE))
+            if not lines:
+                return
+            try:
+                with self.journal.open("ab") as f:
+                    # after a failed write, start on a fresh line so a torn record can't swallow the retry
+                    f.write(b"\n" * self._journal_torn + b"".join(lines))
+                    # timer state is cheap to lose (worst case: last change), only task edits pay for fsync
+                    if n_tasks:
+                        f.flush()
+                        os.fsync(f.fileno())
+            except Exception:
+                # keep the edits queued for the next flush (replaying a record twice is harmless)
+                self._pending[:0] = lines[:n_tasks]
+                if len(lines) > n_tasks:
+                    self._persisted_timer = prev_timer
+                    self._timer_dirty = True
+                self._journal_torn = True
+                raise
+            self._journal_torn = False
+            self._journal_len += len(lines)
+            if self._journal_len > 4 * max(len(self._cache), 16):
+                self._compact()
 
-    def _write(self, tasks: List[Task]) -> None:
-        self.path.write_text(json.dumps([asdict(t) for t in tasks], indent=2))
+    def _compact(self) -> None:
+        self._persisted_timer = self._timer_dict()
+        # the journal's edits were fsynced: the snapshot must be too before it goes
+        self._write(list(self._cache), durable=True)
+        self.journal.unlink(missing_ok=True)
+        self._journal_len = 0
 
-    def _save(self) -> None:
-        self._write(self._cache)
+    def _timer_dict(self) -> dict:
+        return {
+            "active": self._timer_active,
+            "title": self._timer_title,
+            "started": self._timer_started,
+        }
 
-    def _load_timer(self) -> None:
+    def _load_timer(self, data: dict) -> None:
         try:
-            if self.timer_file.exists():
-                data = json.loads(self.timer_file.read_text())
-                self._timer_active = bool(data.get("active", False))
-                self._timer_title = str(data.get("title", ""))
-                self._timer_started = float(data.get("started", 0.0))
+            self._timer_active = bool(data.get("active", False))
+            self._timer_title = str(data.get("title", ""))
+            self._timer_started = float(data.get("started", 0.0))
         except Exception:
             self._timer_active, self._timer_title, self._timer_started = False, "", 0.0
 
-    def _save_timer(self) -> None:
+    def _migrate_timer_file(self) -> None:
+        # Older versions kept the timer in a separate timer_state.json
+        legacy = self.path.with_name("timer_state.json")
+        if not legacy.exists():
+            return
         try:
-            self.timer_file.write_text(json.dumps({
-                "active": self._timer_active,
-                "title": self._timer_title,
-                "started": self._timer_started,
-            }))
+            self._load_timer(orjson.loads(legacy.read_bytes()))
         except Exception:
-            pass
+            return
+        self._save_timer()
+        self._flush()
+        legacy.unlink(missing_ok=True)
+
+    def _save_timer(self) -> None:
+        self._timer_dirty = True
+        self._flusher.mark()
 
     # ---------------- Backend API ----------------
     def refresh(self) -> None:
-        self._cache = self._read()
+        self._reload()
+
+    def _reload(self) -> bool:
+        # Reload tasks and timer from disk; False if no timer state was stored.
+        # journal lines still queued must hit disk before replaying it
+        self._flush()
+        tasks, timer = self._replay(*self._read())
+        self._cache = TaskIndex(tasks)
+        if timer is not None:
+            self._load_timer(timer)
+            self._persisted_timer = self._timer_dict()
+        return timer is not None
+
+    @property
+    def version(self) -> int:
+        return self._cache.version
 
     def list_open(self) -> List[Task]:
-        return [t for t in self._cache if not t.done]
+        return self._cache.open()
 
     def list_done(self) -> List[Task]:
-        return [t for t in self._cache if t.done]
+        return self._cache.done()
 
     def toggle(self, task_id: str) -> Optional[Task]:
-        for t in self._cache:
-            if t.id == task_id:
-                t.done = not t.done
-                self._save()
-                return t
-        return None
+        t = self._cache.get(task_id)
+        if t is None:
+            return None
+        self._cache.set_done(t, not t.done)
+        self._append("upsert", t)
+        return t
 
     def delete(self, task_id: str) -> Optional[Task]:
-        removed: Optional[Task] = None
-        new_list: List[Task] = []
-        for t in self._cache:
-            if t.id == task_id and removed is None:
-                removed = t
-                continue
-            new_list.append(t)
-        self._cache = new_list
-        self._save()
+        removed = self._cache.remove(task_id)
+        if removed is not None:
+            self._append("delete", removed)
         return removed
 
     def ensure(self, title: str) -> Task:
         # Return existing open task with same title, otherwise create new.
-        for t in self._cache:
-            if t.title == title and not t.done:
-                return t
+        t = self._cache.find_open(title)
+        if t is not None:
+            return t
         nt = Task(id=str(uuid.uuid4()), title=title, done=False)
-        self._cache.append(nt)
-        self._save()
+        self._cache.add(nt)
+        self._append("upsert", nt)
         return nt
 
     # ---------------- Timer state (backend-owned) ----------------
@@ -118,9 +267,18 @@ class LocalJsonBackend:
         self._timer_title = title
         self._timer_started = float(started_ts)
         self._save_timer()
+        self._notify_timer_changed()
 
     def stop_timer(self, ended_ts: float) -> None:
         self._timer_active = False
         self._timer_title = ""
         self._timer_started = 0.0
         self._save_timer()
+        self._notify_timer_changed()
+
+    def _notify_timer_changed(self) -> None:
+        with self.timer_changed:
+            self.timer_changed.notify_all()
+
+    def close(self) -> None:
+        self._flusher.close()
@@ -41,3 +41,4 @@ def main(argv=None):
             pass
         finally:
             bg.stop()
+            backend.close()
@@ -4,6 +4,11 @@ import os
 from pathlib import Path
 from typing import Dict, Any
 import yaml
+try:
+    # libyaml-backed loader when available
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 #from taskanov.logging_setup import setup_logging
 
@@ -41,7 +46,7 @@ def load_config() -> Dict[str, Any]:
 
     if cfg_path.exists():
         try:
-            data = yaml.safe_load(cfg_path.read_text()) or {}
+            data = yaml.load(cfg_path.read_bytes(), Loader=SafeLoader) or {}
             # shallow merge; keep defaults when keys are missing
             def merge(dst, src):
                 for k, v in src.items():
@@ -53,7 +58,5 @@ def load_config() -> Dict[str, Any]:
         except Exception as e:
             # ignore parse errors and keep defaults
             pass
-    else:
-        raise("Config is not a YAML")
 
     return defaults
@@ -1,21 +1,39 @@
 # logging_setup.py
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from .config import state_dir
 
+# Records are enqueued by callers and written to disk by the listener thread,
+# so logging from the UI/ticker threads never blocks on file I/O.
+_listener = None
+
 def setup_logging(level: str = "INFO"):
-    log_dir = state_dir() 
-    log_dir.mkdir(parents=True, exist_ok=True)
-    logfile = log_dir / "taskanov.log"
+    global _listener
+    if _listener is None:
+        log_dir = state_dir()
+        log_dir.mkdir(parents=True, exist_ok=True)
+        logfile = log_dir / "taskanov.log"
+
+        file_handler = logging.FileHandler(logfile, encoding="utf-8")
+        file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s"))
+        q: queue.Queue = queue.Queue(-1)
+        _listener = QueueListener(q, file_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+        # QueueHandler pre-formats the message; the file handler adds the layout
+        queue_handler = QueueHandler(q)
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
 
-    logging.basicConfig(
-        level=getattr(logging, level.upper(), logging.INFO),
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        handlers=[
-            logging.FileHandler(logfile, encoding="utf-8"),
-            #logging.StreamHandler(),
-        ],
-    )
+        logging.basicConfig(
+            level=getattr(logging, level.upper(), logging.INFO),
+            handlers=[
+                queue_handler,
+                #logging.StreamHandler(),
+            ],
+        )
     logging.getLogger("googleapiclient.discovery_cache").setLevel(logging.ERROR)
     return logging.getLogger("taskanov")
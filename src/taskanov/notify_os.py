@@ -7,7 +7,16 @@ import subprocess
 import sys
 import time
 import itertools
-from typing import Optional
+import threading
+from functools import lru_cache
+from typing import Dict, Optional
+
+try:
+    # optional: talk to the notification daemon directly instead of spawning notify-send
+    from pydbus import SessionBus
+    from gi.repository import GLib
+except Exception:
+    SessionBus = None
 
 log = logging.getLogger("taskanov.notify")
 
@@ -32,8 +41,10 @@ def notify(
       If `sender` provided (or env set), try once with -sender; on error, retry without.
       `mode="rotate"` forces a new visible banner each time (unique group).
       `mode="replace"` overwrites the previous one (same group).
-    - Linux: uses notify-send if present. In "replace" mode, uses Canonical hint
-      to coalesce cards on GNOME-based desktops (best-effort).
+    - Linux: talks to org.freedesktop.Notifications over a persistent D-Bus
+      connection when pydbus is installed, else uses notify-send if present.
+      In "replace" mode, uses Canonical hint to coalesce cards on GNOME-based
+      desktops (best-effort).
     - Windows/others: falls back to a terminal bell + no-op return.
     """
     try:
@@ -68,8 +79,16 @@ def notify(
         return False
 
 
+@lru_cache(maxsize=None)
+def _which(cmd: str) -> Optional[str]:
+    return shutil.which(cmd)
+
+
 # ------------------------ macOS ------------------------
 
+# Senders terminal-notifier rejected once; don't retry them on every call
+_bad_senders: set = set()
+
 def _notify_macos(
     *,
     title: str,
@@ -79,7 +98,7 @@ def _notify_macos(
     sound: bool,
     sender: Optional[str],
 ) -> bool:
-    tn = shutil.which("terminal-notifier")
+    tn = _which("terminal-notifier")
     if tn:
         grp = f"{group}.{int(time.time()*1000)}.{next(_seq)}" if rotate else group
         base = [tn, "-title", title, "-message", message, "-group", grp]
@@ -88,7 +107,7 @@ def _notify_macos(
 
         # Use explicit sender if provided, else env overrides; try once.
         snd = sender or os.environ.get("TASKANOV_NOTIFY_SENDER") or os.environ.get("__CFBundleIdentifier")
-        if snd:
+        if snd and snd not in _bad_senders:
             res = subprocess.run(
                 base + ["-sender", snd, "-activate", snd] ,
                 capture_output=True,
@@ -96,6 +115,7 @@ def _notify_macos(
             )
             if res.returncode == 0:
                 return True
+            _bad_senders.add(snd)
             # Retry without -sender (shows as 'terminal-notifier')
             log.debug(
                 "terminal-notifier with -sender=%r failed (rc=%s, err=%r). Retrying without.",
@@ -126,7 +146,13 @@ def _notify_linux(
     group: str,
     replace: bool,
 ) -> bool:
-    ns = shutil.which("notify-send")
+    if SessionBus is not None:
+        try:
+            return _notify_dbus(title=title, message=message, app_name=app_name, group=group, replace=replace)
+        except Exception:
+            log.debug("D-Bus notify failed, falling back to notify-send", exc_info=True)
+
+    ns = _which("notify-send")
     if not ns:
         log.debug("notify-send not found")
         return False
@@ -143,3 +169,30 @@ def _notify_linux(
 
     subprocess.run(args, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     return True
+
+
+# Session bus proxy is opened once and reused
+_dbus_lock = threading.Lock()
+_dbus_proxy = None
+# Last notification id per group, used as replaces_id in "replace" mode
+_dbus_ids: Dict[str, int] = {}
+
+
+def _notify_dbus(*, title: str, message: str, app_name: str, group: str, replace: bool) -> bool:
+    global _dbus_proxy
+    with _dbus_lock:
+        if _dbus_proxy is None:
+            _dbus_proxy = SessionBus().get("org.freedesktop.Notifications")
+        hints = {}
+        replaces_id = 0
+        if replace:
+            hints["x-canonical-private-synchronous"] = GLib.Variant("s", group)
+            replaces_id = _dbus_ids.get(group, 0)
+        try:
+            nid = _dbus_proxy.Notify(app_name, replaces_id, "", title, message, [], hints, -1)
+        except Exception:
+            # daemon restarted / bus dropped: reconnect on next call
+            _dbus_proxy = None
+            raise
+        _dbus_ids[group] = nid
+    return True
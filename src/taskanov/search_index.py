@@ -0,0 +1,57 @@
+# src/taskanov/search_index.py
+from __future__ import annotations
+from typing import Dict, List, Set
+
+from .backends import Task
+
+# Below this many tasks a plain scan is cheaper than building/probing the index
+MIN_INDEXED = 64
+
+
+def _matches(t: Task, ft: str, with_list_title: bool) -> bool:
+    if ft in t.title_lower:
+        return True
+    return bool(with_list_title and t.list_title_lower and ft in t.list_title_lower)
+
+
+def filter_tasks(items: List[Task], ft: str, with_list_title: bool) -> List[Task]:
+    """Linear substring filter; `ft` must already be lowercased."""
+    return [t for t in items if _matches(t, ft, with_list_title)]
+
+
+class TrigramIndex:
+    """
+    Trigram -> task positions index over a task list, for substring search.
+    A query is answered by intersecting the posting sets of its trigrams and
+    verifying the (small) candidate set, instead of scanning every title.
+    Queries shorter than 3 chars fall back to a linear scan.
+    """
+
+    def __init__(self, items: List[Task], with_list_title: bool):
+        self.items = items
+        self.with_list_title = with_list_title
+        self._postings: Dict[str, Set[int]] = {}
+        for i, t in enumerate(items):
+            self._add(i, t.title_lower)
+            if with_list_title and t.list_title_lower:
+                self._add(i, t.list_title_lower)
+
+    def _add(self, i: int, text: str) -> None:
+        for j in range(len(text) - 2):
+            self._postings.setdefault(text[j:j + 3], set()).add(i)
+
+    def search(self, ft: str) -> List[Task]:
+        if len(ft) < 3:
+            return filter_tasks(self.items, ft, self.with_list_title)
+        postings = []
+        for gram in {ft[j:j + 3] for j in range(len(ft) - 2)}:
+            hits = self._postings.get(gram)
+            if not hits:
+                return []
+            postings.append(hits)
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return [
+            self.items[i] for i in sorted(candidates)
+            if _matches(self.items[i], ft, self.with_list_title)
+        ]
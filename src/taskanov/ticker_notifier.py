@@ -20,18 +20,46 @@ class TickerNotifier:
 
     def stop(self):
         self._stop.set()
+        cond = getattr(self.backend, "timer_changed", None)
+        if cond is not None:
+            with cond:
+                cond.notify_all()
         if self._thr: self._thr.join(timeout=2)
         log.info("bg: stopped")
 
+    def _wait(self, last_state, timeout):
+        # Sleep until the deadline, or until the backend signals a timer start/stop
+        cond = getattr(self.backend, "timer_changed", None)
+        if cond is None:
+            self._stop.wait(timeout)
+            return
+        with cond:
+            if not self._stop.is_set() and self.backend.get_active_timer() == last_state:
+                cond.wait(timeout)
+
     def _run(self):
         start = time.perf_counter()
-        while not self._stop.wait(self.interval):
+        last_state = self.backend.get_active_timer()
+        deadline = time.monotonic() + self.interval
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                self._wait(last_state, remaining)
+            if self._stop.is_set():
+                return
+            actives = self.backend.get_active_timer()
+            if actives != last_state:
+                # User just started/stopped a timer: restart the countdown instead of nagging
+                last_state = actives
+                deadline = time.monotonic() + self.interval
+                continue
+            if time.monotonic() < deadline:
+                continue
+            deadline = time.monotonic() + self.interval
             self._tick += 1
             uptime = time.perf_counter() - start
-            actives = self.backend.get_active_timer()
             log.debug("actives {} uptime {}".format(actives, uptime))
             if not actives[0]:
                 notify(title="taskanov", message="What are you working on? Open Taskanov")
             else:
                 notify(title="taskanov", message="Are you still working on {}?".format(actives[1]))
-
@@ -4,7 +4,10 @@ from pathlib import Path
 from typing import Tuple, List
 import time, json
 import asyncio, time
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from .backends import Task, Backend
+from .search_index import MIN_INDEXED, TrigramIndex, filter_tasks
 
 from prompt_toolkit.application import Application, get_app
 from prompt_toolkit.key_binding import KeyBindings
@@ -13,7 +16,7 @@ from prompt_toolkit.layout.controls import FormattedTextControl
 from prompt_toolkit.widgets import TextArea
 from prompt_toolkit.styles import Style
 from prompt_toolkit.filters import has_focus, Condition
-from prompt_toolkit.layout.containers import FloatContainer, Float, ConditionalContainer
+from prompt_toolkit.layout.containers import FloatContainer, Float, ConditionalContainer, DynamicContainer
 from prompt_toolkit.formatted_text import fragment_list_width
 
 # Inline modal widgets
@@ -47,40 +50,65 @@ STYLE = Style.from_dict({
 })
 
 # ------------------------ Helpers to draw 1-line framed bars ------------------------
+# Border/padding fragments for the current terminal width; rebuilt when it changes.
+_BORDER_CACHE: dict[tuple, list[tuple]] = {}
+_PAD_CACHE: dict[int, tuple] = {}
+_cache_cols = 0
+# Terminal width sampled once per frame (see TaskTUI._on_before_render); 0 = not sampled yet
+_frame_cols = 0
+
+def _set_frame_cols(cols: int) -> None:
+    global _frame_cols
+    _frame_cols = cols
+
+def _cols() -> int:
+    global _cache_cols
+    cols = max(2, _frame_cols or get_app().output.get_size().columns)
+    if cols != _cache_cols:
+        _BORDER_CACHE.clear()
+        _PAD_CACHE.clear()
+        _cache_cols = cols
+    return cols
+
+def _border(left: str, right: str) -> List[tuple]:
+    cols = _cols()
+    key = (left, right)
+    frag = _BORDER_CACHE.get(key)
+    if frag is None:
+        frag = _BORDER_CACHE[key] = [("class:border", left + "─" * (cols - 2) + right)]
+    return frag
+
 def _line_top() -> List[tuple]:
-    cols = get_app().output.get_size().columns
-    if cols < 2:
-        cols = 2
-    return [("class:border", "┌" + "─" * (cols - 2) + "┐")]
+    return _border("┌", "┐")
 
 def _line_bottom() -> List[tuple]:
-    cols = get_app().output.get_size().columns
-    if cols < 2:
-        cols = 2
-    return [("class:border", "└" + "─" * (cols - 2) + "┘")]
-
-def _line_middle(inner: List[tuple]) -> List[tuple]:
-    cols = get_app().output.get_size().columns
-    if cols < 2:
-        cols = 2
+    return _border("└", "┘")
+
+def _line_middle(inner: List[tuple], width: int) -> List[tuple]:
+    # `width` is the inner's display width (fragment_list_width: emojis/combining, not
+    # len()), precomputed by the caller so memoized inners don't re-measure every frame
+    cols = _cols()
     out: List[tuple] = [("class:border", "│ ")]
     out.extend(inner)
 
-    # Use display width (handles emojis/combining), not len()
-    used = 2 + fragment_list_width(inner)  # left border + inner display width
+    used = 2 + width  # left border + inner display width
 
     # Reserve 1 char for right border; avoid negative pad
     pad = max(0, cols - 1 - used)
     if pad:
-        out.append(("", " " * pad))
+        frag = _PAD_CACHE.get(pad)
+        if frag is None:
+            frag = _PAD_CACHE[pad] = ("", " " * pad)
+        out.append(frag)
     out.append(("class:border", "│"))
     return out
 
 
 def framed_bar(inner_func) -> HSplit:
+    # inner_func returns (fragments, display width)
     return HSplit([
         Window(height=1, content=FormattedTextControl(_line_top)),
-        Window(height=1, content=FormattedTextControl(lambda: _line_middle(inner_func()))),
+        Window(height=1, content=FormattedTextControl(lambda: _line_middle(*inner_func()))),
         Window(height=1, content=FormattedTextControl(_line_bottom)),
     ])
 
@@ -116,19 +144,49 @@ def _fmt_dur(seconds: int) -> str:
     s = seconds % 60
     return f"{h:02d}:{m:02d}:{s:02d}"
 
-def _render_timer_inner(self):
-    # Ask backend for current timer state
-    active, title, started = self.backend.get_active_timer()
-    if not active:
-        return [("class:timer-muted", "No active timer")]
-    elapsed = time.time() - float(started)
-    return [
-        ("class:timer", "⏱  "),
-        ("", "Task: "),
-        ("class:accent", title),
-        ("", "  •  "),
-        ("class:timer", _fmt_dur(int(elapsed))),
-    ]
+# [epoch second, "HH:MM:SS"] of the last status-bar clock string
+_clock_cache = [0, ""]
+
+def _clock() -> str:
+    now_s = int(time.time())
+    if now_s != _clock_cache[0]:
+        lt = time.localtime(now_s)
+        _clock_cache[:] = [now_s, f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"]
+    return _clock_cache[1]
+
+# Minimum seconds between full backend.refresh() syncs after edits ('r' always syncs)
+_SYNC_INTERVAL = 5.0
+
+# Status-bar spinner shown while a backend call is in flight
+_SPINNER = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+
+# ---------------- static fragments, built once at import ----------------
+# Bar inners go through _line_middle and may be tuples; fragments handed straight to a
+# FormattedTextControl must be lists (prompt_toolkit only reads them, so sharing is safe).
+_HEADER_FRAGMENTS = (
+    ("class:title", "taskanov "), ("", "• "),
+    ("class:accent", "↑/↓"), ("", " move  "),
+    ("class:accent", "n"), ("", " new  "),
+    ("class:accent", "s"), ("", " start timer  "),
+    ("class:accent", "x"), ("", " stop timer "),
+    ("class:accent", "Space"), ("", " done  "),
+    ("class:accent", "d"), ("", " del  "),
+    ("class:accent", "/"), ("", " search  "),
+    ("class:accent", "Tab"), ("", " focus  "),
+    ("class:accent", "q"), ("", " quit"),
+)
+_HEADER_WIDTH = fragment_list_width(_HEADER_FRAGMENTS)
+_NO_TIMER_FRAGMENTS = (("class:timer-muted", "No active timer"),)
+_NO_TIMER_WIDTH = fragment_list_width(_NO_TIMER_FRAGMENTS)
+_NO_OPEN_FRAGMENTS = [("class:muted", "\n  (no open tasks)\n")]
+_NO_DONE_FRAGMENTS = [("class:muted", "\n  (no completed tasks)\n")]
+_OPEN_TITLE_FRAGMENTS = [("class:section-title", " Aperti ")]
+_DONE_TITLE_FRAGMENTS = [("class:section-title", " Completati ")]
+_SEARCH_TITLE_FRAGMENTS = [("class:popup-title", " Live search ")]
+_RESULTS_TAIL = ("class:popup-hint", "  •  Enter/Esc: close")
+
+# Fixed leading fragments of the timer bar
+_TIMER_PREFIX = (("class:timer", "⏱  "), ("", "Task: "))
 
 
 # -----------------------------------------------------------------------------------
@@ -147,11 +205,46 @@ class TaskTUI:
         self.idx_done = 0
         self.filter_text = ""
         self._ticker_paused = False
-
-        # Inline "New task" modal state
+        self._redraw_pending = False
+        # Timer/status bar (fragments, width) memoized on what they display
+        self._timer_render_cache: tuple = (None, None)
+        self._status_render_cache: tuple = (None, None)
+
+        # Backend calls run off the event loop, one at a time (backends aren't thread-safe)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="taskanov-backend")
+        self._busy = 0
+        self._newtask_opening = False
+        self._newtask_saving = False
+        # Backends load their data on construction, so the UI starts in sync
+        self._last_sync = time.monotonic()
+        # Optional backend capabilities (task lists), resolved once
+        self._backend_list_lists = getattr(backend, "list_lists", None)
+        self._backend_create_in_list = getattr(backend, "create_in_list", None)
+
+        # Snapshot of the backend lists the UI renders from; refreshed after every backend call
+        self._snap_version = backend.version
+        self._cached_open: List[Task] = backend.list_open()
+        self._cached_done: List[Task] = backend.list_done()
+
+        # Filtered lists memoized on (snapshot version, filter text)
+        self._filt_cache_open: tuple = (None, None)
+        self._filt_cache_done: tuple = (None, None)
+        # Column fragments memoized on (version, filter, focused pane, selection)
+        self._open_render_cache: tuple = (None, None)
+        self._done_render_cache: tuple = (None, None)
+        # Trigram indexes for large lists, rebuilt lazily per backend version
+        self._open_index: tuple = (None, None)
+        self._done_index: tuple = (None, None)
+
+        # Inline "New task" modal state (widgets are built once in _build_main_layout)
         self.newtask_visible = False
-        self.newtask_title_input: PTTextArea | None = None
-        self.newtask_list_widget: RadioList | None = None
+        self._newtask_has_lists = False
+
+        # Visibility filters, shared by every container that depends on them
+        self._search_filter = Condition(lambda: self.search_visible)
+        self._newtask_filter = Condition(lambda: self.newtask_visible)
+        self._search_or_newtask_filter = Condition(lambda: self.search_visible or self.newtask_visible)
+        self._newtask_lists_filter = Condition(lambda: self._newtask_has_lists)
 
         self._build_main_layout()
 
@@ -167,7 +260,7 @@ class TaskTUI:
         # Open tasks column
         self.open_title = Window(
             height=1,
-            content=FormattedTextControl(lambda: [("class:section-title", " Aperti ")]),
+            content=FormattedTextControl(_OPEN_TITLE_FRAGMENTS),
         )
         self.open_ctrl = FormattedTextControl(self._render_open, focusable=True)
         self.open_win = Window(content=self.open_ctrl, always_hide_cursor=True)
@@ -175,7 +268,7 @@ class TaskTUI:
         # Done tasks column
         self.done_title = Window(
             height=1,
-            content=FormattedTextControl(lambda: [("class:section-title", " Completati ")]),
+            content=FormattedTextControl(_DONE_TITLE_FRAGMENTS),
         )
         self.done_ctrl = FormattedTextControl(self._render_done, focusable=True)
         self.done_win = Window(content=self.done_ctrl, always_hide_cursor=True)
@@ -196,7 +289,7 @@ class TaskTUI:
         def _popup_results_line():
             # Live result count
             count = len(self._filtered_open()) + len(self._filtered_done())
-            return [("class:popup-hint", f" Results: {count}  •  Enter/Esc: close")]
+            return [("class:popup-hint", f" Results: {count}"), _RESULTS_TAIL]
 
         def _accept_search(_buffer):
             # Close popup on Enter
@@ -214,7 +307,7 @@ class TaskTUI:
         self.search_input.buffer.on_text_changed += self._on_search_change
 
         popup_body = HSplit([
-            Window(height=1, content=FormattedTextControl(lambda: [("class:popup-title", " Live search ")])),
+            Window(height=1, content=FormattedTextControl(_SEARCH_TITLE_FRAGMENTS)),
             self.search_input,
             Window(height=1, content=FormattedTextControl(_popup_results_line)),
         ])
@@ -223,7 +316,7 @@ class TaskTUI:
         self.search_veil = Float(
             content=ConditionalContainer(
                 content=Window(style="class:veil"),
-                filter=Condition(lambda: self.search_visible or self.newtask_visible),
+                filter=self._search_or_newtask_filter,
             )
         )
 
@@ -231,17 +324,40 @@ class TaskTUI:
         self.search_float = Float(
             content=ConditionalContainer(
                 content=popup_box(popup_body),
-                filter=Condition(lambda: self.search_visible),
+                filter=self._search_filter,
             ),
             top=3, left=6, right=6,
         )
 
         # ---------- Inline "New task" modal ----------
-        # Placeholder float; content is swapped on open to rebuild fresh widgets.
+        # Built once; opening the modal resets the title and swaps in a fresh list selector
+        # (a new RadioList is the only public way to reset its choices and cursor).
+        self.newtask_title_input = PTTextArea(multiline=False, prompt=" Title: ")
+        # RadioList needs at least one value; the placeholder is hidden until lists are loaded
+        self.newtask_list_widget = RadioList([(None, "")])
+
+        def on_ok():
+            self.app.create_background_task(self._confirm_newtask_modal())
+
+        def on_cancel():
+            self._close_newtask_modal()
+
+        newtask_dialog = Dialog(
+            title="New task",
+            body=HSplit([
+                ConditionalContainer(
+                    content=DynamicContainer(lambda: self.newtask_list_widget),
+                    filter=self._newtask_lists_filter,
+                ),
+                self.newtask_title_input,
+            ], padding=1),
+            buttons=[Button(text="OK", handler=on_ok), Button(text="Cancel", handler=on_cancel)],
+            with_background=True,
+        )
         self.newtask_float = Float(
             content=ConditionalContainer(
-                content=Window(height=1, char=" "),
-                filter=Condition(lambda: self.newtask_visible),
+                content=popup_box(newtask_dialog),
+                filter=self._newtask_filter,
             ),
             top=3, left=6, right=6,
         )
@@ -268,84 +384,50 @@ class TaskTUI:
             style=STYLE,
             full_screen=True,
         )
-
-    def _soft_rebuild(self):
-        """Rebuild main layout tree and force a clean relayout/repaint."""
-        log.info("running soft_rebuild")
-        self._build_main_layout()
-        self.root.content = self.root_main
-        self.app.layout.focus(self.open_win)
-        self.app.layout.reset()
-        get_app().invalidate()
+        self.app.before_render += self._on_before_render
 
     # ---------- inline "New task" modal ----------
-    def _open_newtask_modal(self):
+    async def _open_newtask_modal(self):
         """Open the inline 'New task' dialog (list selector if available + title)."""
-        # Rebuild widgets fresh each time to avoid stale cursor/measure state
-        self.newtask_title_input = PTTextArea(multiline=False, prompt=" Title: ")
-        lists = []
-        if hasattr(self.backend, "list_lists"):
-            try:
-                lists = self.backend.list_lists()
-            except Exception:
-                lists = []
+        if self._newtask_opening:
+            return
+        self._newtask_opening = True
+        try:
+            lists = []
+            if self._backend_list_lists:
+                try:
+                    lists = await self._run_blocking(self._backend_list_lists)
+                except Exception:
+                    lists = []
+        finally:
+            self._newtask_opening = False
+        if self.search_visible or self.newtask_visible:
+            return
 
+        # Reset the dialog: empty title, fresh list choices with the first selected
+        self.newtask_title_input.text = ""
+        self._newtask_has_lists = bool(lists)
         if lists:
             self.newtask_list_widget = RadioList([(lid, name) for (lid, name) in lists])
-            body = HSplit([self.newtask_list_widget, self.newtask_title_input], padding=1)
-        else:
-            self.newtask_list_widget = None
-            body = HSplit([self.newtask_title_input], padding=1)
-
-        def on_ok():
-            self._confirm_newtask_modal()
-
-        def on_cancel():
-            self._close_newtask_modal()
-
-        dialog = Dialog(
-            title="New task",
-            body=body,
-            buttons=[Button(text="OK", handler=on_ok), Button(text="Cancel", handler=on_cancel)],
-            with_background=True,
-        )
-
-        # Swap float content to our framed popup box
-        self.newtask_float.content = ConditionalContainer(
-            content=popup_box(dialog),
-            filter=Condition(lambda: self.newtask_visible),
-        )
         self.newtask_visible = True
         self.app.layout.focus(self.newtask_title_input)
-        self.app.invalidate()
+        self._request_redraw()
 
-    def _confirm_newtask_modal(self):
+    async def _confirm_newtask_modal(self):
         """Read values, create task, autostart timer, then close modal."""
-        title = (self.newtask_title_input.text or "").strip() if self.newtask_title_input else ""
+        if self._newtask_saving:
+            return
+        title = (self.newtask_title_input.text or "").strip()
         if not title:
             # Keep focus if empty title
-            if self.newtask_title_input:
-                self.app.layout.focus(self.newtask_title_input)
+            self.app.layout.focus(self.newtask_title_input)
             return
 
-        list_choice = self.newtask_list_widget.current_value if self.newtask_list_widget else None
+        list_choice = self.newtask_list_widget.current_value if self._newtask_has_lists else None
 
+        self._newtask_saving = True
         try:
-            # Create task in backend
-            if list_choice and hasattr(self.backend, "create_in_list"):
-                self.backend.create_in_list(title, list_choice)
-            else:
-                self.backend.ensure(title)
-            self.backend.refresh()
-            self.idx_open = 0
-
-            # Auto-start timer on the newly created task
-            now = time.time()
-            active, cur_title, _started = self.backend.get_active_timer()
-            if active and cur_title != title:
-                self.backend.stop_timer(now)
-            self.backend.start_timer(title, now)
-
+            await self._run_blocking(self._create_and_start, title, list_choice)
         except Exception:
             # Log silently; keep modal open (you can add an error label if you want)
             try:
@@ -353,105 +435,151 @@ class TaskTUI:
             except Exception:
                 pass
             return
+        finally:
+            self._newtask_saving = False
+        self.idx_open = 0
 
-        # Close modal + soft relayout
+        # Close modal (restores focus and repaints)
         self._close_newtask_modal()
 
+    def _create_and_start(self, title: str, list_choice):
+        """Runs in the backend worker: create the task, then move the timer onto it."""
+        if list_choice and self._backend_create_in_list:
+            self._backend_create_in_list(title, list_choice)
+        else:
+            self.backend.ensure(title)
+        self._sync_if_due()
+
+        # Auto-start timer on the newly created task
+        now = time.time()
+        active, cur_title, _started = self.backend.get_active_timer()
+        if active and cur_title != title:
+            self.backend.stop_timer(now)
+        self.backend.start_timer(title, now)
+
     def _close_newtask_modal(self):
         """Close the inline modal and restore focus + repaint."""
         self.newtask_visible = False
         self.app.layout.focus(self.open_win)
         self.app.layout.reset()
-        self.app.invalidate()
+        self._request_redraw()
 
     # ---------- header & status inner content (without borders) ----------
-    def _render_header_inner(self) -> List[tuple]:
-        return [
-            ("class:title", "taskanov "), ("", "• "),
-            ("class:accent", "↑/↓"), ("", " move  "),
-            ("class:accent", "n"), ("", " new  "),
-            ("class:accent", "s"), ("", " start timer  "),
-            ("class:accent", "x"), ("", " stop timer "),
-            ("class:accent", "Space"), ("", " done  "),
-            ("class:accent", "d"), ("", " del  "),
-            ("class:accent", "/"), ("", " search  "),
-            ("class:accent", "Tab"), ("", " focus  "),
-            ("class:accent", "q"), ("", " quit"),
-        ]
+    # Inner renderers return (fragments, display width) for _line_middle
+    def _render_header_inner(self) -> Tuple[List[tuple], int]:
+        return _HEADER_FRAGMENTS, _HEADER_WIDTH
 
-    def _render_status_inner(self) -> List[tuple]:
-        from datetime import datetime
+    def _render_status_inner(self) -> Tuple[List[tuple], int]:
         o, d = len(self._filtered_open()), len(self._filtered_done())
-        clock = datetime.now().strftime("%H:%M:%S")
+        clock = _clock()
+        spin = _SPINNER[int(time.time() * 10) % len(_SPINNER)] if self._busy else ""
+        key = (o, d, self.filter_text, self.focus_done, clock, spin)
+        if self._status_render_cache[0] == key:
+            return self._status_render_cache[1]
         filt = f" | filter: '{self.filter_text}'" if self.filter_text else ""
         pane = "DONE" if self.focus_done else "OPEN"
-        return [
+        frags = [
             ("", f"Open: {o}  •  Done: {d}{filt}"),
             ("", "  |  pane: "),
             ("class:accent", pane),
             ("", "    "),
             ("class:muted", clock),
         ]
+        if spin:
+            frags.append(("class:accent", "  " + spin))
+        self._status_render_cache = (key, (frags, fragment_list_width(frags)))
+        return self._status_render_cache[1]
 
-    def _render_timer_inner(self):
-        # Ask backend for current timer state
+    def _render_timer_inner(self) -> Tuple[List[tuple], int]:
+        # Ask backend for current timer state (backends keep `started` as a float)
         active, title, started = self.backend.get_active_timer()
         if not active:
-            return [("class:timer-muted", "No active timer")]
-        elapsed = time.time() - float(started)
-        return [
-            ("class:timer", "⏱  "),
-            ("", "Task: "),
+            return _NO_TIMER_FRAGMENTS, _NO_TIMER_WIDTH
+        # intra-second repaints (keypresses) reuse the formatted line and its width
+        key = (title, int(time.time() - started))
+        if self._timer_render_cache[0] == key:
+            return self._timer_render_cache[1]
+        frags = [
+            *_TIMER_PREFIX,
             ("class:accent", title),
             ("", "  •  "),
-            ("class:timer", _fmt_dur(int(elapsed))),
+            ("class:timer", _fmt_dur(key[1])),
         ]
+        self._timer_render_cache = (key, (frags, fragment_list_width(frags)))
+        return self._timer_render_cache[1]
 
     # ---------- filtering ----------
     def _filtered_open(self) -> List[Task]:
-        items = self.backend.list_open()
-        if not self.filter_text:
-            return items
-        ft = self.filter_text.lower()
-        return [
-            t for t in items
-            if (ft in t.title.lower()) or (getattr(t, "list_title", None) and ft in t.list_title.lower())
-        ]
+        key = (self._snap_version, self.filter_text)
+        if self._filt_cache_open[0] == key:
+            return self._filt_cache_open[1]
+        items = self._cached_open
+        if self.filter_text:
+            ft = self.filter_text.lower()
+            if len(items) < MIN_INDEXED:
+                items = filter_tasks(items, ft, with_list_title=True)
+            else:
+                if self._open_index[0] != key[0]:
+                    self._open_index = (key[0], TrigramIndex(items, with_list_title=True))
+                items = self._open_index[1].search(ft)
+        self._filt_cache_open = (key, items)
+        return items
 
     def _filtered_done(self) -> List[Task]:
-        items = self.backend.list_done()
-        if not self.filter_text:
-            return items
-        ft = self.filter_text.lower()
-        return [t for t in items if ft in t.title.lower()]
+        key = (self._snap_version, self.filter_text)
+        if self._filt_cache_done[0] == key:
+            return self._filt_cache_done[1]
+        items = self._cached_done
+        if self.filter_text:
+            ft = self.filter_text.lower()
+            if len(items) < MIN_INDEXED:
+                items = filter_tasks(items, ft, with_list_title=False)
+            else:
+                if self._done_index[0] != key[0]:
+                    self._done_index = (key[0], TrigramIndex(items, with_list_title=False))
+                items = self._done_index[1].search(ft)
+        self._filt_cache_done = (key, items)
+        return items
 
     # ---------- list renderers ----------
-    def _label_task(self, t) -> str:
-        list_name = (t.list_title or "").replace(" ", "")
-        return f"{list_name} / {t.title}" if getattr(t, "list_title", None) else t.title
+    def _render_rows(self, items: List[Task], marker: str, selected: int, style: str) -> List[tuple]:
+        # One fragment per style run (rows before / selected row / rows after), not one per row
+        rows = [f"  {marker}{t.label}\n" for t in items]
+        if not 0 <= selected < len(rows):
+            return [(style, "".join(rows))]
+        out: List[tuple] = []
+        if selected:
+            out.append((style, "".join(rows[:selected])))
+        out.append(("class:selected", rows[selected]))
+        if selected + 1 < len(rows):
+            out.append((style, "".join(rows[selected + 1:])))
+        return out
 
     def _render_open(self) -> List[tuple]:
-        lines: List[tuple] = []
+        key = (self._snap_version, self.filter_text, self.focus_done, self.idx_open)
+        if self._open_render_cache[0] == key:
+            return self._open_render_cache[1]
         items = self._filtered_open()
         if not items:
-            return [("class:muted", "\n  (no open tasks)\n")]
-        for i, t in enumerate(items):
-            marker = "● "
-            style = "class:selected" if (not self.focus_done and i == self.idx_open) else ""
-            lines.append((style, f"  {marker}{self._label_task(t)}\n"))
-        return lines
+            frags = _NO_OPEN_FRAGMENTS
+        else:
+            selected = -1 if self.focus_done else self.idx_open
+            frags = self._render_rows(items, "● ", selected, "")
+        self._open_render_cache = (key, frags)
+        return frags
 
     def _render_done(self) -> List[tuple]:
-        lines: List[tuple] = []
+        key = (self._snap_version, self.filter_text, self.focus_done, self.idx_done)
+        if self._done_render_cache[0] == key:
+            return self._done_render_cache[1]
         items = self._filtered_done()
         if not items:
-            return [("class:muted", "\n  (no completed tasks)\n")]
-        for i, t in enumerate(items):
-            marker = "✔ "
-            style = "class:selected" if (self.focus_done and i == self.idx_done) else "class:done"
-            lines.append((style, f"  {marker}{t.title}\n"))
-            lines.append((style, f"  {marker}{self._label_task(t)}\n"))
-        return lines
+            frags = _NO_DONE_FRAGMENTS
+        else:
+            selected = self.idx_done if self.focus_done else -1
+            frags = self._render_rows(items, "✔ ", selected, "class:done")
+        self._done_render_cache = (key, frags)
+        return frags
 
     # ---------- logic ----------
     def _move(self, delta: int):
@@ -490,7 +618,7 @@ class TaskTUI:
                 return False
 
             # Typing in new-task title?
-            if self.newtask_visible and self.newtask_title_input and app and app.layout.has_focus(self.newtask_title_input):
+            if self.newtask_visible and app and app.layout.has_focus(self.newtask_title_input):
                 return False
 
             return True
@@ -499,23 +627,112 @@ class TaskTUI:
 
     # ---------- async run & clock ----------
     async def _ticker(self):
-        while True:
-            await asyncio.sleep(1)
+        last_shown = None
+        while not self.app.is_done:
+            # Wake just after the wall-clock second rolls so the status clock never skips
+            await asyncio.sleep(1.0 - time.time() % 1.0)
             if self._ticker_paused:
                 continue
-            try:
-                app = get_app()
-            except Exception:
-                app = None
-            if app is self.app:
-                self.app.invalidate()
+            # Only repaint when something the bars display has changed
+            shown = (int(time.time()), self.backend.get_active_timer())
+            if shown != last_shown:
+                last_shown = shown
+                self._request_redraw()
+
+    def _on_before_render(self, app):
+        # One size query per frame, shared by every framed bar
+        _set_frame_cols(app.output.get_size().columns)
+
+    # ---------- backend calls off the event loop ----------
+    async def _run_blocking(self, fn, *args, resnapshot: bool = True):
+        """Run a (possibly network-bound) backend call in the worker thread; UI keeps painting."""
+        self._busy += 1
+        self._request_redraw()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(fn, *args))
+        finally:
+            self._busy -= 1
+            if resnapshot:
+                await self.refresh_async()
+            self._request_redraw()
+
+    def _sync(self) -> None:
+        """Runs in the backend worker: full backend.refresh()."""
+        self.backend.refresh()
+        self._last_sync = time.monotonic()
+
+    def _sync_if_due(self) -> None:
+        """Runs in the backend worker: refresh only if the last sync is older than _SYNC_INTERVAL."""
+        if time.monotonic() - self._last_sync >= _SYNC_INTERVAL:
+            self._sync()
+
+    def _toggle(self, task_id: str):
+        """
+        Runs in the backend worker: toggle and capture the resulting (task, done, version)
+        there, since later queued calls may change both before the UI applies the result.
+        version is None if the toggle changed nothing.
+        """
+        before = self.backend.version
+        t = self.backend.toggle(task_id)
+        after = self.backend.version
+        if t is None or after == before:
+            return t, None, None
+        return t, t.done, after
+
+    def _move_toggled(self, t: Task, done: bool, version: int) -> None:
+        """Move a toggled task between the snapshots instead of re-listing the backend."""
+        if version <= self._snap_version:
+            return  # snapshot already reflects this (or a later) state
+        others_open = [x for x in self._cached_open if x.id != t.id]
+        others_done = [x for x in self._cached_done if x.id != t.id]
+        if done:
+            self._cached_open, self._cached_done = others_open, others_done + [t]
+        else:
+            self._cached_open, self._cached_done = others_open + [t], others_done
+        self._snap_version = version
+
+    def _snapshot(self):
+        """Runs in the backend worker, so it never overlaps a backend call."""
+        return self.backend.version, self.backend.list_open(), self.backend.list_done()
+
+    async def refresh_async(self):
+        """Re-snapshot open and done lists (queued behind any pending backend call)."""
+        loop = asyncio.get_running_loop()
+        version, open_items, done_items = await loop.run_in_executor(self._executor, self._snapshot)
+        if version >= self._snap_version:
+            self._cached_open, self._cached_done = open_items, done_items
+            self._snap_version = version
+
+    # ---------- redraw coalescing ----------
+    def _request_redraw(self):
+        """Mark the UI dirty; the actual invalidate() runs once, on the next loop iteration."""
+        if self._redraw_pending:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.app.invalidate()
+            return
+        self._redraw_pending = True
+        loop.call_soon(self._flush_redraw)
+
+    def _flush_redraw(self):
+        self._redraw_pending = False
+        self.app.invalidate()
 
     async def _run_async(self):
-        self.app.create_background_task(self._ticker())
-        await self.app.run_async()
+        ticker = asyncio.ensure_future(self._ticker())
+        try:
+            await self.app.run_async()
+        finally:
+            ticker.cancel()
 
     def run(self):
-        asyncio.run(self._run_async())
+        try:
+            asyncio.run(self._run_async())
+        finally:
+            self._executor.shutdown(wait=True)
 
     # ---------- search popup ----------
     def _on_search_change(self, _):
@@ -523,7 +740,7 @@ class TaskTUI:
         self.filter_text = self.search_input.text.strip()
         # reset selections to top for both lists
         self.idx_open = self.idx_done = 0
-        get_app().invalidate()
+        self._request_redraw()
 
     def _open_search(self):
         if self.search_visible or self.newtask_visible:
@@ -538,7 +755,7 @@ class TaskTUI:
             return
         self.search_visible = False
         self.app.layout.focus(self.open_win)
-        get_app().invalidate()
+        self._request_redraw()
 
     # ---------- key bindings ----------
     def _keys(self):
@@ -558,18 +775,21 @@ class TaskTUI:
             self._move(1)
 
         @kb.add(" ", filter=typing_ok)
-        def _(e):
+        async def _(e):
             pane, t = self._current_task()
             if not t:
                 return
-            self.backend.toggle(t.id)
+            # A toggle only moves one task: patch the snapshots instead of re-listing
+            toggled, done, version = await self._run_blocking(self._toggle, t.id, resnapshot=False)
+            if version is not None:
+                self._move_toggled(toggled, done, version)
 
         @kb.add("d", filter=typing_ok)
-        def _(e):
+        async def _(e):
             pane, t = self._current_task()
             if not t:
                 return
-            self.backend.delete(t.id)
+            await self._run_blocking(self.backend.delete, t.id)
             if self.focus_done:
                 self.idx_done = max(0, self.idx_done - 1)
             else:
@@ -602,19 +822,18 @@ class TaskTUI:
                 self.search_input.buffer.document = self.search_input.buffer.document.set_text("")
 
         @kb.add("r", filter=typing_ok)
-        def _(e):
-            self.backend.refresh()
+        async def _(e):
+            await self._run_blocking(self._sync)
 
         @kb.add("x", filter=typing_ok)
-        def _(e):
+        async def _(e):
             # Force stop current timer
             active, title, started = self.backend.get_active_timer()
             if active:
-                self.backend.stop_timer(time.time())
-                get_app().invalidate()
+                await self._run_blocking(self.backend.stop_timer, time.time())
 
         @kb.add("s", filter=typing_ok)
-        def _(e):
+        async def _(e):
             """
             Start the timer on the selected task (NO toggle).
             - If another task has an active timer: stop it first, then start this one.
@@ -623,24 +842,26 @@ class TaskTUI:
             pane, t = self._current_task()
             if not t:
                 return
-            now = time.time()
-            try:
+
+            def switch(title: str, now: float):
                 active, cur_title, _started = self.backend.get_active_timer()
-                if active and cur_title != t.title:
+                if active and cur_title != title:
                     self.backend.stop_timer(now)
-                if not active or cur_title != t.title:
-                    self.backend.start_timer(t.title, now)
-                get_app().invalidate()
+                if not active or cur_title != title:
+                    self.backend.start_timer(title, now)
+
+            try:
+                await self._run_blocking(switch, t.title, time.time())
             except Exception:
                 # TODO: log/show error
                 pass
 
         @kb.add("n", filter=typing_ok)
-        def _(e):
+        async def _(e):
             """Open the inline 'New task' modal (list selector if available + title)."""
             if self.search_visible or self.newtask_visible:
                 return
-            self._open_newtask_modal()
+            await self._open_newtask_modal()
 
         return kb
 